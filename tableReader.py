@@ -1,17 +1,95 @@
 import re
 import json
 import hashlib
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
-
-RE_FLOAT = r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?"
+import functools
+import string
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # optional: faster JSONL writes when installed
+except ImportError:
+    orjson = None
+
+# Integer part and fraction never compete for the same digits, so failed matches backtrack less
+RE_FLOAT = r"[-+]?(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][-+]?\d+)?"
+
+# Compiled once at import; the parsers below run these per cell.
+_RE_WS = re.compile(r"\s+")
+_RE_GRAMS = re.compile(rf"({RE_FLOAT})\s*g\b")
+_RE_S_VAL = re.compile(rf"(<\s*{RE_FLOAT}\s*g\b|{RE_FLOAT}\s*g\b)")
+_RE_TEMP_RANGE = re.compile(r"(\d+)\s*[–-]\s*(\d+)\s*°?C")
+_RE_TEMP = re.compile(rf"({RE_FLOAT})\s*°?C")
+# Time range ("30–60 min") or single time ("15 min") in one scan
+_RE_TIME_COMBO = re.compile(rf"(?P<lo>{RE_FLOAT})\s*[–-]\s*(?P<hi>{RE_FLOAT})\s*min|(?P<time>{RE_FLOAT})\s*min")
+_RE_PA = re.compile(rf"({RE_FLOAT})\s*Pa\b", re.IGNORECASE)
+_RE_TORR = re.compile(rf"({RE_FLOAT})\s*Torr\b", re.IGNORECASE)
+_RE_MULTISPACE = re.compile(r"\s{2,}")
+
+_GAS_CHARS = frozenset(string.ascii_letters + string.digits + "()")
+
+class QualityFlag:
+    """
+    Bit values for quality flags. Parsers and build_one OR these into one int;
+    flag_names turns the mask into the label list written to quality.flags.
+    """
+    APPROXIMATE = 1 << 0
+    TEMP_PROFILE = 1 << 1
+    RANGE_UNRESOLVED = 1 << 2
+    PRESSURE_ASSUMED_AMBIENT = 1 << 3
+    PRESSURE_MISSING = 1 << 4
+    PRESSURE_UNPARSED = 1 << 5
+    GAS_FLOW_UNPARSED = 1 << 6
+    INEQUALITY = 1 << 7
+    SULFUR_VAGUE = 1 << 8
+    MO_AMOUNT_MISSING = 1 << 9
+    AMBIGUOUS = 1 << 10
+    REVIEW_TABLE_ROW = 1 << 11
+
+# Output labels, in the order they appear in quality.flags
+_FLAG_NAMES = (
+    ("approximate_value_present", QualityFlag.APPROXIMATE),
+    ("temperature_profile_unparsed", QualityFlag.TEMP_PROFILE),
+    ("range_value_unresolved", QualityFlag.RANGE_UNRESOLVED),
+    ("pressure_assumed_ambient", QualityFlag.PRESSURE_ASSUMED_AMBIENT),
+    ("pressure_missing", QualityFlag.PRESSURE_MISSING),
+    ("pressure_unparsed", QualityFlag.PRESSURE_UNPARSED),
+    ("gas_flow_unparsed", QualityFlag.GAS_FLOW_UNPARSED),
+    ("inequality_value_present", QualityFlag.INEQUALITY),
+    ("sulfur_amount_vague", QualityFlag.SULFUR_VAGUE),
+    ("mo_source_amount_missing", QualityFlag.MO_AMOUNT_MISSING),
+    ("ambiguous_value", QualityFlag.AMBIGUOUS),
+    ("review_table_row", QualityFlag.REVIEW_TABLE_ROW),
+)
+
+def flag_names(flags: int) -> List[str]:
+    return [name for name, bit in _FLAG_NAMES if flags & bit]
+
+# Mo source cell substring -> reactant label, in priority order; default MoO3 powder
+_MO_NEEDLES = (
+    ("MoCl5", "MoCl5 powder"),
+    ("MoS2", "MoS2 powder"),
+    ("nanoribbons", "MoO3 nanoribbons"),
+)
+
+# material: this table is MoS2 growth parameters (assume MoS2, but you can set null if you want stricter)
+TABLE_MATERIAL: Optional[str] = "MoS2"
+TABLE_GROWTH_METHOD: Optional[str] = "TVD CVD"
 
 def sha_id(*parts: str) -> str:
-    h = hashlib.sha1("||".join(parts).encode("utf-8")).hexdigest()
-    return h[:16]
+    # 8-byte BLAKE2b digest -> 16 hex chars; IDs only need to be stable, not cryptographic
+    return hashlib.blake2b("||".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+def _id_prefix_hasher(doi: str) -> Any:
+    """
+    BLAKE2b state after hashing "<doi>||", so sha_id(doi, rid) only has to feed rid.
+    Built once per table; .copy() it before update().
+    """
+    return hashlib.blake2b((doi + "||").encode("utf-8"), digest_size=8)
 
+@functools.lru_cache(maxsize=4096)
 def clean(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip())
+    return _RE_WS.sub(" ", s.strip())
 
 def parse_g_mass_list(cell: str) -> List[Optional[float]]:
     """
@@ -21,135 +99,201 @@ def parse_g_mass_list(cell: str) -> List[Optional[float]]:
       "-" -> [None]
       "<0.1 g" -> [None]  (stored as notes; numeric not set)
     """
-    cell = clean(cell).replace(" ", " ")
+    cell = clean(cell)
     if cell in {"-", "–", "—"}:
         return [None]
-    if "<" in cell or ">" in cell or "rich" in cell.lower() or "∼" in cell:
+    # Allocation-free literal checks first; lowercase only if they all miss
+    if "<" in cell or ">" in cell or "∼" in cell or "rich" in cell.lower():
         return [None]
-    vals = re.findall(rf"({RE_FLOAT})\s*g\b", cell)
+    vals = _RE_GRAMS.findall(cell)
     if not vals:
         # Might be "MoO3 nanoribbons" etc.
         return [None]
     return [float(v) for v in vals]
 
 def parse_s_amount_notes(cell: str) -> str:
-    return clean(cell).replace(" ", " ")
+    return clean(cell)
 
-def parse_temp_time(cell: str) -> Tuple[Optional[float], Optional[float], List[str], Dict[str, List[str]]]:
+def parse_temp_time(cell: str) -> Tuple[Optional[float], Optional[float], int, Dict[str, List[str]]]:
     """
-    Returns temperature_C, growth_time_min, flags, evidence_map
+    Returns temperature_C, growth_time_min, flags (QualityFlag mask), evidence_map
     Handles:
-      "650 °C 15 min" -> (650, 15, [], evidence)
-      "780–650 °C 10 min" -> (None, 10, ["temperature_profile_unparsed"], evidence)
-      "530 °C 30–60 min" -> (530, None, ["range_value_unresolved"], evidence)
-      "∼650 °C/ 15 – 20 min" -> (None, None, ["approximate_value_present","range_value_unresolved"], evidence)
+      "650 °C 15 min" -> (650, 15, 0, evidence)
+      "780–650 °C 10 min" -> (None, 10, TEMP_PROFILE, evidence)
+      "530 °C 30–60 min" -> (530, None, RANGE_UNRESOLVED, evidence)
+      "∼650 °C/ 15 – 20 min" -> (None, None, APPROXIMATE|RANGE_UNRESOLVED, evidence)
     """
-    raw = clean(cell).replace(" ", " ")
-    flags: List[str] = []
+    raw = clean(cell)
+    flags = 0
     evidence = {"temperature_C": [raw], "growth_time_min": [raw]}
 
     # Approximate marker
     if "∼" in raw or "~" in raw:
-        flags.append("approximate_value_present")
+        flags |= QualityFlag.APPROXIMATE
+
+    # Cheap literal checks first: each pattern below needs one of these
+    # substrings, so skip the regex entirely when it can't match.
+    has_dash = "–" in raw or "-" in raw
+    has_min = "min" in raw
 
     # Temperature profile like 780–650 °C
-    if re.search(r"(\d+)\s*[–-]\s*(\d+)\s*°?C", raw):
-        flags.append("temperature_profile_unparsed")
+    if has_dash and _RE_TEMP_RANGE.search(raw):
+        flags |= QualityFlag.TEMP_PROFILE
         temp_C = None
     else:
-        m = re.search(rf"({RE_FLOAT})\s*°?C", raw)
+        m = _RE_TEMP.search(raw) if "C" in raw else None
         temp_C = float(m.group(1)) if m else None
 
-    # Time range like 30–60 min or 2–6 min or 10 – 15 min
-    if re.search(rf"({RE_FLOAT})\s*[–-]\s*({RE_FLOAT})\s*min", raw):
-        flags.append("range_value_unresolved")
-        time_min = None
-    else:
-        m = re.search(rf"({RE_FLOAT})\s*min", raw)
-        time_min = float(m.group(1)) if m else None
-
-    # If time present but temp is profile, we keep time_min (e.g., 10 min)
-    if "temperature_profile_unparsed" in flags:
-        m = re.search(rf"({RE_FLOAT})\s*min", raw)
-        if m:
-            time_min = float(m.group(1))
+    # Time range like 30–60 min or 2–6 min or 10 – 15 min anywhere in the cell
+    # leaves time unresolved; otherwise the first single time wins. A
+    # temperature profile doesn't affect time ("780–650 °C 10 min" keeps 10 min)
+    time_min = None
+    if has_min:
+        for m in _RE_TIME_COMBO.finditer(raw):
+            if m.group("lo") is not None:
+                flags |= QualityFlag.RANGE_UNRESOLVED
+                time_min = None
+                break
+            if time_min is None:
+                time_min = float(m.group("time"))
 
     return temp_C, time_min, flags, evidence
 
-def parse_pressure(cell: str) -> Tuple[Optional[float], List[str], List[str]]:
+def parse_pressure(cell: str) -> Tuple[Optional[float], int, List[str]]:
     """
-    Returns pressure_Torr, flags, evidence_snippets
+    Returns pressure_Torr, flags (QualityFlag mask), evidence_snippets
     Handles:
-      "ambient" -> (760, ["pressure_assumed_ambient"], ["ambient"])
-      "–" -> (None, ["pressure_missing"], ["–"])
-      "30 Pa" -> (~0.225, [], ["30 Pa"])
-      "2 Torr" -> (2, [], ["2 Torr"])
-      "780 Torr" -> (780, [], ["780 Torr"])
+      "ambient" -> (760, PRESSURE_ASSUMED_AMBIENT, ["ambient"])
+      "–" -> (None, PRESSURE_MISSING, ["–"])
+      "30 Pa" -> (~0.225, 0, ["30 Pa"])
+      "2 Torr" -> (2, 0, ["2 Torr"])
+      "780 Torr" -> (780, 0, ["780 Torr"])
     """
-    raw = clean(cell).replace(" ", " ")
+    raw = clean(cell)
     evid = [raw]
-    if raw.lower() == "ambient":
-        return 760.0, ["pressure_assumed_ambient"], evid
+    low = raw.lower()
+    if low == "ambient":
+        return 760.0, QualityFlag.PRESSURE_ASSUMED_AMBIENT, evid
     if raw in {"-", "–", "—"}:
-        return None, ["pressure_missing"], evid
+        return None, QualityFlag.PRESSURE_MISSING, evid
 
-    m = re.search(rf"({RE_FLOAT})\s*Pa\b", raw, re.IGNORECASE)
+    m = _RE_PA.search(raw) if "pa" in low else None
     if m:
         pa = float(m.group(1))
         torr = pa / 133.322
-        return torr, [], evid
+        return torr, 0, evid
 
-    m = re.search(rf"({RE_FLOAT})\s*Torr\b", raw, re.IGNORECASE)
+    m = _RE_TORR.search(raw) if "torr" in low else None
     if m:
-        return float(m.group(1)), [], evid
+        return float(m.group(1)), 0, evid
 
     # Unknown
-    return None, ["pressure_unparsed"], evid
+    return None, QualityFlag.PRESSURE_UNPARSED, evid
 
-def parse_gas_flows(cell: str) -> Tuple[List[str], Dict[str, float], List[str], List[str]]:
+def _scan_float(s: str, i: int) -> int:
+    """
+    Returns the end index of an RE_FLOAT match starting at s[i], or i if none.
+    """
+    n = len(s)
+    j = i
+    if j < n and s[j] in "+-":
+        j += 1
+    k = j
+    while k < n and s[k].isdecimal():
+        k += 1
+    if k + 1 < n and s[k] == "." and s[k + 1].isdecimal():
+        k += 2
+        while k < n and s[k].isdecimal():
+            k += 1
+    if k == j:
+        return i
+    # Optional exponent, only consumed when digits follow
+    e = k
+    if e < n and s[e] in "eE":
+        e += 1
+        if e < n and s[e] in "+-":
+            e += 1
+        if e < n and s[e].isdecimal():
+            while e < n and s[e].isdecimal():
+                e += 1
+            k = e
+    return k
+
+def _scan_sccm(s: str, i: int) -> int:
+    """
+    Returns the end index of "<spaces or slashes>sccm" at s[i] ending on a word boundary, or -1.
     """
-    Returns carrier_gas list, gas_flows_sccm dict, flags, evidence_snippets.
+    n = len(s)
+    while i < n and (s[i].isspace() or s[i] == "/"):
+        i += 1
+    if not s.startswith("sccm", i):
+        return -1
+    i += 4
+    if i < n and (s[i].isalnum() or s[i] == "_"):
+        return -1
+    return i
+
+def parse_gas_flows(cell: str) -> Tuple[List[str], Dict[str, float], int, List[str]]:
+    """
+    Returns carrier_gas list, gas_flows_sccm dict, flags (QualityFlag mask), evidence_snippets.
     Handles:
       "N2 1 sccm"
       "Ar 10 sccm"
       "Ar14 sccm H2/2 sccm"  (no space)
       "Ar14 sccm H2/2 sccm"  (with slash)
+      "Ar14sccm", "Ar.5 sccm"
     """
-    raw = clean(cell).replace(" ", " ")
+    raw = clean(cell)
     evid = [raw]
-    flags: List[str] = []
 
-    # Find patterns like "Ar 10 sccm" or "Ar14 sccm" or "H2/2 sccm"
+    # Single pass over "Ar 10 sccm" / "Ar14 sccm" / "H2/2 sccm" tokens.
     # Gas token: letters/numbers/() e.g., N2, Ar, H2, (C2H5)2S (we’ll keep as-is)
-    pairs: List[Tuple[str, float]] = []
-
-    # Normalize separators
-    tmp = raw.replace("/", " ")
-    # Match "Gas 10 sccm" where gas may be adjacent to number (Ar14)
-    for m in re.finditer(rf"([A-Za-z0-9\(\)]+)\s*({RE_FLOAT})\s*sccm\b", tmp):
-        gas = m.group(1)
-        val = float(m.group(2))
-        pairs.append((gas, val))
-
-    if not pairs:
-        flags.append("gas_flow_unparsed")
-        return [], {}, flags, evid
-
+    # Repeated gases keep their first position and their last value.
     flows: Dict[str, float] = {}
-    gases: List[str] = []
-    for gas, val in pairs:
-        flows[gas] = val
-        gases.append(gas)
+    n = len(raw)
+    i = 0
+    while i < n:
+        if raw[i] not in _GAS_CHARS:
+            i += 1
+            continue
+        start = i
+        while i < n and raw[i] in _GAS_CHARS:
+            i += 1
+        word_end = i
+        # A unit glued to the number ("Ar14sccm") ends up inside the word;
+        # cut the word there and leave the unit to _scan_sccm
+        k = raw.find("sccm", start + 1, word_end)
+        if k != -1 and raw[k - 1].isdecimal():
+            word_end = k
+
+        # Separated value: "Ar 10 sccm", "H2/2 sccm", "Ar-5 sccm", "Ar.5 sccm"
+        j = word_end
+        while j < n and (raw[j].isspace() or raw[j] == "/"):
+            j += 1
+        gas_end = word_end
+        num_end = j
+        if (j > word_end or (j < n and raw[j] in "+-")
+                or (j < n and raw[j] == "." and not raw[word_end - 1].isdecimal())):
+            num_end = _scan_float(raw, j)
+        if num_end == j:
+            # Value glued to the gas token: "Ar14 sccm" -> Ar, 14
+            j = word_end
+            while j > start and raw[j - 1].isdecimal():
+                j -= 1
+            if not start < j < word_end:
+                continue
+            gas_end = j
+            num_end = _scan_float(raw, j)
+        end = _scan_sccm(raw, num_end)
+        if end < 0:
+            continue
+        flows[raw[start:gas_end]] = float(raw[j:num_end])
+        i = end
 
-    # De-dup while preserving order
-    seen = set()
-    gases_unique = []
-    for g in gases:
-        if g not in seen:
-            gases_unique.append(g)
-            seen.add(g)
+    if not flows:
+        return [], {}, QualityFlag.GAS_FLOW_UNPARSED, evid
 
-    return gases_unique, flows, flags, evid
+    return list(flows), flows, 0, evid
 
 def split_multi_load_row(mo_cell: str, s_cell: str) -> Optional[List[Tuple[Optional[float], str]]]:
     """
@@ -157,11 +301,11 @@ def split_multi_load_row(mo_cell: str, s_cell: str) -> Optional[List[Tuple[Optio
     return a list of paired (mo_g, s_note) entries.
     Otherwise return None.
     """
-    mo_cell_c = clean(mo_cell).replace(" ", " ")
-    s_cell_c = clean(s_cell).replace(" ", " ")
+    mo_cell_c = clean(mo_cell)
+    s_cell_c = clean(s_cell)
 
-    mo_vals = re.findall(rf"({RE_FLOAT})\s*g\b", mo_cell_c)
-    s_vals = re.findall(rf"(<\s*{RE_FLOAT}\s*g\b|{RE_FLOAT}\s*g\b)", s_cell_c)
+    mo_vals = _RE_GRAMS.findall(mo_cell_c)
+    s_vals = _RE_S_VAL.findall(s_cell_c)
 
     # Heuristic: if Mo has 2+ numeric grams AND S has 2+ tokens, we treat as paired lists
     if len(mo_vals) >= 2 and len(s_vals) >= 2:
@@ -176,6 +320,8 @@ def split_multi_load_row(mo_cell: str, s_cell: str) -> Optional[List[Tuple[Optio
 
 @dataclass
 class Record:
+    # Explicit __slots__ (dataclass(slots=True) needs 3.10+): no per-record __dict__
+    __slots__ = ("record_id", "paper", "condition", "outcomes", "evidence", "quality")
     record_id: str
     paper: Dict[str, Any]
     condition: Dict[str, Any]
@@ -183,36 +329,81 @@ class Record:
     evidence: Dict[str, List[str]]
     quality: Dict[str, Any]
 
+def record_to_dict(r: Record) -> Dict[str, Any]:
+    """
+    Shallow dict of a Record for JSON output. The nested fields are already
+    plain dicts/lists, so this skips the recursive deep copy asdict() does.
+    """
+    return {
+        "record_id": r.record_id,
+        "paper": r.paper,
+        "condition": r.condition,
+        "outcomes": r.outcomes,
+        "evidence": r.evidence,
+        "quality": r.quality,
+    }
+
+# Record skeletons; make_base shallow-copies these per record
+_CONDITION_TEMPLATE: Dict[str, Any] = {
+    "material": None,
+    "growth_method": None,
+    "substrate": None,
+    "temperature_C": None,
+    "pressure_Torr": None,
+    "growth_time_min": None,
+    "carrier_gas": None,
+    "reactants": None,
+    "gas_flows_sccm": None,
+    "ramp_rate_C_per_min": None,
+    "cooldown": None,
+    "anneal": None,
+    "transfer_method": None,
+    "notes": None,
+}
+_ANNEAL_TEMPLATE: Dict[str, Any] = {"temperature_C": None, "time_min": None, "atmosphere": None}
+_OUTCOMES_TEMPLATE: Dict[str, Any] = {
+    "device_type": None,
+    "mobility_cm2_Vs": None,
+    "on_off_ratio": None,
+    "vth_V": None,
+    "contact_resistance_Ohm_um": None,
+    "yield_percent": None,
+    "layer_count": None,
+    "domain_size_um": None,
+    "defect_density_cm2": None,
+}
+
+def dumps_record(r: Record) -> bytes:
+    """
+    Compact UTF-8 JSON for one record; orjson when available, else stdlib json
+    with matching separators. Both decode to the same values for finite numbers,
+    but float spelling can differ (orjson "1e-6" vs json "1e-06"), and orjson
+    writes NaN/inf as null where json writes NaN/Infinity.
+    """
+    d = record_to_dict(r)
+    if orjson is not None:
+        return orjson.dumps(d)
+    return json.dumps(d, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_jsonl(path: str, records: List[Record], chunk_size: int = 10000) -> None:
+    """
+    Writes one record per line, joining each chunk of records into a single write.
+    """
+    with open(path, "wb") as f:
+        for i in range(0, len(records), chunk_size):
+            f.write(b"".join([dumps_record(r) + b"\n" for r in records[i:i + chunk_size]]))
+
 def make_base(paper_meta: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, List[str]], Dict[str, Any]]:
     paper = dict(paper_meta)
-    condition = {
-        "material": None,
-        "growth_method": None,
-        "substrate": None,
-        "temperature_C": None,
-        "pressure_Torr": None,
-        "growth_time_min": None,
-        "carrier_gas": [],
-        "reactants": [],
-        "gas_flows_sccm": {},
-        "ramp_rate_C_per_min": None,
-        "cooldown": None,
-        "anneal": {"temperature_C": None, "time_min": None, "atmosphere": None},
-        "transfer_method": None,
-        "notes": None,
-    }
-    outcomes = {
-        "device_type": None,
-        "mobility_cm2_Vs": None,
-        "on_off_ratio": None,
-        "vth_V": None,
-        "contact_resistance_Ohm_um": None,
-        "yield_percent": None,
-        "layer_count": None,
-        "domain_size_um": None,
-        "defect_density_cm2": None,
-    }
-    evidence = {
+    # Copy the templates and fill in fresh containers; assigned keys keep
+    # their template position, so the JSON key order is unchanged
+    condition = _CONDITION_TEMPLATE.copy()
+    condition["carrier_gas"] = []
+    condition["reactants"] = []
+    condition["gas_flows_sccm"] = {}
+    condition["anneal"] = _ANNEAL_TEMPLATE.copy()
+    outcomes = _OUTCOMES_TEMPLATE.copy()
+    evidence: Dict[str, List[str]] = {
         "temperature_C": [],
         "pressure_Torr": [],
         "growth_time_min": [],
@@ -224,7 +415,181 @@ def make_base(paper_meta: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any
     quality = {"confidence": 0.0, "missing_required_fields": [], "flags": []}
     return paper, condition, outcomes, evidence, quality
 
-def row_to_records(cols: Dict[str, str], paper_meta: Dict[str, Any], table_id: str, row_index: int) -> List[Record]:
+def score_confidence(temp_C: Optional[float], pressure_Torr: Optional[float], growth_time_min: Optional[float],
+                     flags: int) -> float:
+    """
+    Rule-based confidence for a table-mode record, from the three key values
+    and the QualityFlag mask alone (no record dicts needed).
+    """
+    conf = 0.90  # table mode base
+    if temp_C is None:
+        conf -= 0.15
+    if pressure_Torr is None:
+        conf -= 0.15
+    if growth_time_min is None:
+        conf -= 0.15
+    if flags & QualityFlag.AMBIGUOUS:
+        conf -= 0.10
+    if flags & QualityFlag.RANGE_UNRESOLVED:
+        conf -= 0.08
+    if flags & QualityFlag.TEMP_PROFILE:
+        conf -= 0.12
+    return max(0.0, min(1.0, conf))
+
+# Per-table memo of parser results keyed by (parser, raw cell)
+ParseCache = Dict[Tuple[Callable[[str], Any], str], Any]
+
+def parse_cached(cache: Optional[ParseCache], parser: Callable[[str], Any], cell: str) -> Any:
+    """
+    Runs parser(cell), reusing an earlier result for the same cell from cache.
+    Tables repeat the same cell text down a column ("ambient", "Ar 10 sccm"),
+    so table_to_records shares one cache across all rows of a table.
+    Cached results are shared, so callers must copy before mutating them.
+    """
+    if cache is None:
+        return parser(cell)
+    key = (parser, cell)
+    hit = cache.get(key)
+    if hit is None:
+        hit = cache[key] = parser(cell)
+    return hit
+
+@dataclass
+class _RowCtx:
+    """
+    Row-invariant values shared by every condition built from one table row.
+    """
+    __slots__ = (
+        "mo_clean", "s_clean", "substrate_clean", "tC", "tmin", "tev", "pT", "pev",
+        "gases", "flows", "gev", "reactants", "row_flags", "ref", "paper_meta", "table_id", "row_index",
+        "paired", "id_hasher", "material", "growth_method",
+    )
+    mo_clean: str
+    s_clean: str
+    substrate_clean: str
+    tC: Optional[float]
+    tmin: Optional[float]
+    tev: Dict[str, List[str]]
+    pT: Optional[float]
+    pev: List[str]
+    gases: List[str]
+    flows: Dict[str, float]
+    gev: List[str]
+    reactants: List[str]
+    row_flags: int
+    ref: str
+    paper_meta: Dict[str, Any]
+    table_id: str
+    row_index: int
+    paired: Optional[List[Tuple[Optional[float], str]]]
+    id_hasher: Any  # _id_prefix_hasher(doi), never updated in place
+    material: Optional[str]
+    growth_method: Optional[str]
+
+class _ConditionQuality(NamedTuple):
+    record_id: str
+    notes: str
+    confidence: float
+    missing_required_fields: List[str]
+    flags: List[str]
+
+def _condition_quality(ctx: _RowCtx, mo_override_g: Optional[float], s_override_note: Optional[str],
+                       suffix: Optional[str]) -> _ConditionQuality:
+    """
+    Per-condition record_id, notes, confidence, missing_required_fields and flags,
+    shared by _build_one and table_to_columns. Lists returned are fresh.
+    """
+    notes_parts = []
+    if mo_override_g is not None:
+        notes_parts.append(f"Mo source load override from paired list: {mo_override_g} g")
+    else:
+        notes_parts.append(f"Mo source cell: {ctx.mo_clean}")
+
+    if s_override_note is not None:
+        notes_parts.append(f"S source load override from paired list: {s_override_note}")
+    elif ctx.s_clean:
+        notes_parts.append(f"S source cell: {ctx.s_clean}")
+
+    notes_parts.append(f"Cited ref: {ctx.ref}.")
+    notes = " ".join(notes_parts)
+
+    flags = ctx.row_flags
+    if s_override_note and "<" in s_override_note:
+        flags |= QualityFlag.INEQUALITY
+
+    # Required-field tracking (soft)
+    missing = []
+    if ctx.material is None: missing.append("material")
+    if ctx.growth_method is None: missing.append("growth_method")
+    if ctx.tC is None: missing.append("temperature_C")
+
+    # Confidence
+    conf = score_confidence(ctx.tC, ctx.pT, ctx.tmin, flags)
+
+    # Always include provenance flags
+    flags |= QualityFlag.REVIEW_TABLE_ROW
+    flag_list = flag_names(flags)
+    if ctx.ref:
+        flag_list.append(f"cited_ref_{ctx.ref}")
+    if suffix is not None:
+        flag_list.append("row_split_into_multiple_conditions")
+
+    rid = f"{ctx.table_id}_r{ctx.row_index}" + (f"_{suffix}" if suffix else "")
+    # Same value as sha_id(doi, rid), without rehashing the DOI for every record
+    h = ctx.id_hasher.copy()
+    h.update(rid.encode("utf-8"))
+    return _ConditionQuality(record_id=h.hexdigest(), notes=notes, confidence=conf,
+                             missing_required_fields=missing, flags=flag_list)
+
+def _conditions(ctx: _RowCtx) -> List[Tuple[Optional[float], Optional[str], Optional[str]]]:
+    """
+    (mo_override_g, s_override_note, suffix) for each condition of a row.
+    """
+    if ctx.paired:
+        # Split into multiple conditions
+        return [(mo_g, s_note, str(i)) for i, (mo_g, s_note) in enumerate(ctx.paired, start=1)]
+    return [(None, None, None)]
+
+def _build_one(ctx: _RowCtx, mo_override_g: Optional[float], s_override_note: Optional[str], suffix: Optional[str]) -> Record:
+    paper, condition, outcomes, evidence, quality = make_base(ctx.paper_meta)
+
+    condition["material"] = ctx.material
+    condition["growth_method"] = ctx.growth_method
+    evidence["growth_method"].append("Table 3 (TVD growth parameters)")
+
+    condition["substrate"] = ctx.substrate_clean
+    evidence["substrate"].append(ctx.substrate_clean)
+
+    # temp/time
+    condition["temperature_C"] = ctx.tC
+    condition["growth_time_min"] = ctx.tmin
+    for k, v in ctx.tev.items():
+        evidence[k].extend(v)
+
+    # pressure
+    condition["pressure_Torr"] = ctx.pT
+    evidence["pressure_Torr"].extend(ctx.pev)
+
+    # gas flows
+    condition["carrier_gas"] = list(ctx.gases)
+    condition["gas_flows_sccm"] = dict(ctx.flows)
+    evidence["gas_flows_sccm"].extend(ctx.gev)
+
+    # reactants + loads notes
+    condition["reactants"] = list(ctx.reactants)
+    evidence["reactants"].append(ctx.mo_clean)
+    if ctx.s_clean:
+        evidence["reactants"].append(ctx.s_clean)
+
+    q = _condition_quality(ctx, mo_override_g, s_override_note, suffix)
+    condition["notes"] = q.notes
+    quality["confidence"] = q.confidence
+    quality["missing_required_fields"] = q.missing_required_fields
+    quality["flags"] = q.flags
+    return Record(record_id=q.record_id, paper=paper, condition=condition, outcomes=outcomes, evidence=evidence, quality=quality)
+
+def _row_context(cols: Dict[str, str], paper_meta: Dict[str, Any], table_id: str, row_index: int,
+                 cache: Optional[ParseCache], id_hasher: Any) -> _RowCtx:
     mo = cols["Mo source"]
     s = cols.get("Sulfur source", "")
     temp_time = cols.get("Temp. Time", "")
@@ -236,140 +601,75 @@ def row_to_records(cols: Dict[str, str], paper_meta: Dict[str, Any], table_id: s
     # Multi-load paired split (Ref 56-like)
     paired = split_multi_load_row(mo, s)
 
-    def build_one(mo_override_g: Optional[float], s_override_note: Optional[str], suffix: Optional[str]) -> Record:
-        paper, condition, outcomes, evidence, quality = make_base(paper_meta)
-
-        # material: this table is MoS2 growth parameters (assume MoS2, but you can set null if you want stricter)
-        condition["material"] = "MoS2"
-        condition["growth_method"] = "TVD CVD"
-        evidence["growth_method"].append("Table 3 (TVD growth parameters)")
-
-        condition["substrate"] = clean(substrate)
-        evidence["substrate"].append(clean(substrate))
-
-        # temp/time
-        tC, tmin, tflags, tev = parse_temp_time(temp_time)
-        condition["temperature_C"] = tC
-        condition["growth_time_min"] = tmin
-        for k, v in tev.items():
-            evidence[k].extend(v)
-        quality["flags"].extend(tflags)
-
-        # pressure
-        pT, pflags, pev = parse_pressure(pressure)
-        condition["pressure_Torr"] = pT
-        evidence["pressure_Torr"].extend(pev)
-        quality["flags"].extend(pflags)
-
-        # gas flows
-        gases, flows, gflags, gev = parse_gas_flows(gas)
-        condition["carrier_gas"] = gases
-        condition["gas_flows_sccm"] = flows
-        evidence["gas_flows_sccm"].extend(gev)
-        quality["flags"].extend(gflags)
-
-        # reactants + loads notes
-        reactants = []
-        mo_clean = clean(mo).replace(" ", " ")
-        s_clean = clean(s).replace(" ", " ")
-
-        # Detect source species label
-        if "MoCl5" in mo_clean:
-            reactants.append("MoCl5 powder")
-        elif "MoS2" in mo_clean:
-            reactants.append("MoS2 powder")
-        elif "nanoribbons" in mo_clean:
-            reactants.append("MoO3 nanoribbons")
-        else:
-            reactants.append("MoO3 powder")
-
-        if "Single source" not in mo_clean and "MoS2 powder" not in mo_clean:
-            # sulfur source exists for most rows
-            if "H2S" in s_clean:
-                reactants.append("H2S")
-            elif s_clean:
-                reactants.append("S powder")
-
-        condition["reactants"] = reactants
-        evidence["reactants"].append(mo_clean)
-        if s_clean:
-            evidence["reactants"].append(s_clean)
-
-        notes_parts = []
-        if mo_override_g is not None:
-            notes_parts.append(f"Mo source load override from paired list: {mo_override_g} g")
-        else:
-            notes_parts.append(f"Mo source cell: {mo_clean}")
-
-        if s_override_note is not None:
-            notes_parts.append(f"S source load override from paired list: {s_override_note}")
-        elif s_clean:
-            notes_parts.append(f"S source cell: {s_clean}")
-
-        notes_parts.append(f"Cited ref: {ref}.")
-        condition["notes"] = " ".join(notes_parts)
-
-        # Flags for vague/inequality
-        if "<" in s_clean or (s_override_note and "<" in s_override_note):
-            quality["flags"].append("inequality_value_present")
-        if "rich" in s_clean.lower():
-            quality["flags"].append("sulfur_amount_vague")
-        if mo_clean.endswith("-") or mo_clean.strip() in {"-", "–", "—"}:
-            quality["flags"].append("mo_source_amount_missing")
-        if "∼" in mo_clean or "∼" in s_clean:
-            quality["flags"].append("approximate_value_present")
-
-        # Required-field tracking (soft)
-        missing = []
-        if condition["material"] is None: missing.append("material")
-        if condition["growth_method"] is None: missing.append("growth_method")
-        if condition["temperature_C"] is None: missing.append("temperature_C")
-        quality["missing_required_fields"] = missing
-
-        # Confidence
-        conf = 0.90  # table mode base
-        for fld in ("temperature_C", "pressure_Torr", "growth_time_min"):
-            if condition[fld] is None:
-                conf -= 0.15
-        if "ambiguous_value" in quality["flags"]:
-            conf -= 0.10
-        if "range_value_unresolved" in quality["flags"]:
-            conf -= 0.08
-        if "temperature_profile_unparsed" in quality["flags"]:
-            conf -= 0.12
-        conf = max(0.0, min(1.0, conf))
-        quality["confidence"] = conf
-
-        # Always include provenance flags
-        quality["flags"].append("review_table_row")
-        if ref:
-            quality["flags"].append(f"cited_ref_{ref}")
-
-        rid = f"{table_id}_r{row_index}" + (f"_{suffix}" if suffix else "")
-        rec_id = sha_id(paper_meta.get("doi",""), rid)
-        return Record(record_id=rec_id, paper=paper, condition=condition, outcomes=outcomes, evidence=evidence, quality=quality)
-
-    records: List[Record] = []
-    if paired:
-        # Split into multiple conditions
-        for i, (mo_g, s_note) in enumerate(paired, start=1):
-            rec = build_one(mo_override_g=mo_g, s_override_note=s_note, suffix=str(i))
-            rec.quality["flags"].append("row_split_into_multiple_conditions")
-            records.append(rec)
+    # Everything below depends only on the row, so it is done once and
+    # shared by every split condition; _condition_quality adds per-override bits
+    mo_clean = clean(mo)
+    s_clean = clean(s)
+    substrate_clean = clean(substrate)
+    tC, tmin, tflags, tev = parse_cached(cache, parse_temp_time, temp_time)
+    pT, pflags, pev = parse_cached(cache, parse_pressure, pressure)
+    gases, flows, gflags, gev = parse_cached(cache, parse_gas_flows, gas)
+
+    # reactants
+    reactants = []
+
+    # Detect source species label (first needle wins)
+    for needle, label in _MO_NEEDLES:
+        if needle in mo_clean:
+            reactants.append(label)
+            break
     else:
-        records.append(build_one(mo_override_g=None, s_override_note=None, suffix=None))
+        reactants.append("MoO3 powder")
 
-    return records
+    if "Single source" not in mo_clean and "MoS2 powder" not in mo_clean:
+        # sulfur source exists for most rows
+        if "H2S" in s_clean:
+            reactants.append("H2S")
+        elif s_clean:
+            reactants.append("S powder")
+
+    # Flags for vague/inequality
+    row_flags = tflags | pflags | gflags
+    if "<" in s_clean:
+        row_flags |= QualityFlag.INEQUALITY
+    if "rich" in s_clean.lower():
+        row_flags |= QualityFlag.SULFUR_VAGUE
+    if mo_clean.endswith("-") or mo_clean.strip() in {"-", "–", "—"}:
+        row_flags |= QualityFlag.MO_AMOUNT_MISSING
+    if "∼" in mo_clean or "∼" in s_clean:
+        row_flags |= QualityFlag.APPROXIMATE
+
+    return _RowCtx(
+        mo_clean=mo_clean, s_clean=s_clean, substrate_clean=substrate_clean,
+        tC=tC, tmin=tmin, tev=tev, pT=pT, pev=pev, gases=gases, flows=flows, gev=gev,
+        reactants=reactants, row_flags=row_flags, ref=ref,
+        paper_meta=paper_meta, table_id=table_id, row_index=row_index, paired=paired,
+        id_hasher=id_hasher, material=TABLE_MATERIAL, growth_method=TABLE_GROWTH_METHOD,
+    )
+
+def row_to_records(cols: Dict[str, str], paper_meta: Dict[str, Any], table_id: str, row_index: int,
+                   cache: Optional[ParseCache] = None, id_hasher: Any = None) -> List[Record]:
+    if id_hasher is None:
+        id_hasher = _id_prefix_hasher(paper_meta.get("doi", ""))
+    ctx = _row_context(cols, paper_meta, table_id, row_index, cache, id_hasher)
+    return [_build_one(ctx, mo_g, s_note, suffix) for mo_g, s_note, suffix in _conditions(ctx)]
+
+def _split_table_line(line: str) -> List[str]:
+    """
+    Splits a stripped line on runs of tabs, or on 2+ spaces if tabs were lost.
+    """
+    if "\t" in line:
+        # Same as splitting on \t+: a stripped line has no edge tabs, so the
+        # only empty parts come from consecutive tabs
+        return [p for p in line.split("\t") if p]
+    return _RE_MULTISPACE.split(line)
 
 def parse_table_block(block: str) -> List[Dict[str, str]]:
-    lines = [l for l in block.splitlines() if clean(l)]
-    header = re.split(r"\t+", lines[0].strip())
+    lines = [l for l in (raw.strip() for raw in block.splitlines()) if l]
+    header = _split_table_line(lines[0]) if "\t" in lines[0] else [lines[0]]
     rows: List[Dict[str, str]] = []
     for line in lines[1:]:
-        parts = re.split(r"\t+", line.strip())
-        # If tabs were lost, fall back to 2+ spaces as delimiter
-        if len(parts) == 1:
-            parts = re.split(r"\s{2,}", line.strip())
+        parts = _split_table_line(line)
         if len(parts) < len(header):
             # Skip malformed line
             continue
@@ -378,6 +678,56 @@ def parse_table_block(block: str) -> List[Dict[str, str]]:
     return rows
     #change
 
+def table_to_records(rows: List[Dict[str, str]], paper_meta: Dict[str, Any], table_id: str) -> List[Record]:
+    """
+    Converts parsed table rows to records, parsing each distinct
+    Temp. Time / Pressure / gas cell once per table.
+    """
+    cache: ParseCache = {}
+    id_hasher = _id_prefix_hasher(paper_meta.get("doi", ""))
+    out_recs: List[Record] = []
+    for idx, cols in enumerate(rows, start=1):
+        out_recs.extend(row_to_records(cols, paper_meta, table_id=table_id, row_index=idx,
+                                       cache=cache, id_hasher=id_hasher))
+    return out_recs
+
+def table_to_columns(rows: List[Dict[str, str]], paper_meta: Dict[str, Any], table_id: str) -> Dict[str, List[Any]]:
+    """
+    Column-oriented (one list per field) version of table_to_records for bulk
+    consumers, e.g. pyarrow.Table.from_pydict or pandas.DataFrame. Built from
+    the row contexts directly, so no Record / outcomes / evidence dicts are made.
+    Every list/dict cell is a fresh object.
+    """
+    cache: ParseCache = {}
+    cols: Dict[str, List[Any]] = {k: [] for k in (
+        "record_id", "doi", "material", "growth_method", "substrate",
+        "temperature_C", "pressure_Torr", "growth_time_min",
+        "carrier_gas", "gas_flows_sccm", "reactants", "notes",
+        "confidence", "missing_required_fields", "flags",
+    )}
+    doi = paper_meta.get("doi")
+    id_hasher = _id_prefix_hasher("" if doi is None else doi)
+    for idx, row in enumerate(rows, start=1):
+        ctx = _row_context(row, paper_meta, table_id, idx, cache, id_hasher)
+        for mo_g, s_note, suffix in _conditions(ctx):
+            q = _condition_quality(ctx, mo_g, s_note, suffix)
+            cols["record_id"].append(q.record_id)
+            cols["doi"].append(doi)
+            cols["material"].append(ctx.material)
+            cols["growth_method"].append(ctx.growth_method)
+            cols["substrate"].append(ctx.substrate_clean)
+            cols["temperature_C"].append(ctx.tC)
+            cols["pressure_Torr"].append(ctx.pT)
+            cols["growth_time_min"].append(ctx.tmin)
+            cols["carrier_gas"].append(list(ctx.gases))
+            cols["gas_flows_sccm"].append(dict(ctx.flows))
+            cols["reactants"].append(list(ctx.reactants))
+            cols["notes"].append(q.notes)
+            cols["confidence"].append(q.confidence)
+            cols["missing_required_fields"].append(q.missing_required_fields)
+            cols["flags"].append(q.flags)
+    return cols
+
 
 def main():
     # Paste your table block here (must include header row)
@@ -393,14 +743,10 @@ MoO3 powder 0.4 g\tS powder 0.8 g\t650 C 15 min\tambient\tN2 1 sccm\tSiO2/Si fac
     }
 
     rows = parse_table_block(table_text)
-    out_recs: List[Record] = []
-    for idx, cols in enumerate(rows, start=1):
-        out_recs.extend(row_to_records(cols, paper_meta, table_id="cvde201500060_table3", row_index=idx))
+    out_recs = table_to_records(rows, paper_meta, table_id="cvde201500060_table3")
 
     # Write JSONL
-    with open("extractions.jsonl", "w", encoding="utf-8") as f:
-        for r in out_recs:
-            f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
+    write_jsonl("extractions.jsonl", out_recs)
 
     print(f"Wrote {len(out_recs)} records to extractions.jsonl")
 
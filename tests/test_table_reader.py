@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tableReader as tr
+
+
+class ParseGasFlowsTest(unittest.TestCase):
+    def assertFlows(self, cell, flows):
+        gases, got, flags, _ = tr.parse_gas_flows(cell)
+        self.assertEqual(got, flows)
+        self.assertEqual(gases, list(flows))
+        self.assertEqual(flags, 0)
+
+    def test_documented_examples(self):
+        self.assertFlows("N2 1 sccm", {"N2": 1.0})
+        self.assertFlows("Ar 10 sccm", {"Ar": 10.0})
+        self.assertFlows("Ar14 sccm H2/2 sccm", {"Ar": 14.0, "H2": 2.0})
+
+    def test_unit_glued_to_value(self):
+        self.assertFlows("Ar14sccm", {"Ar": 14.0})
+        self.assertFlows("Ar14sccm H2/2sccm", {"Ar": 14.0, "H2": 2.0})
+
+    def test_decimal_values(self):
+        self.assertFlows("Ar1.5 sccm", {"Ar": 1.5})
+        self.assertFlows("Ar.5 sccm", {"Ar": 0.5})
+
+    def test_repeated_gas_keeps_last_value(self):
+        self.assertFlows("Ar 50 sccm Ar 20 sccm", {"Ar": 20.0})
+
+    def test_unparsed(self):
+        gases, flows, flags, _ = tr.parse_gas_flows("none")
+        self.assertEqual((gases, flows), ([], {}))
+        self.assertEqual(flags, tr.QualityFlag.GAS_FLOW_UNPARSED)
+
+
+class ParseTempTimeTest(unittest.TestCase):
+    def test_documented_examples(self):
+        F = tr.QualityFlag
+        self.assertEqual(tr.parse_temp_time("650 °C 15 min")[:3], (650.0, 15.0, 0))
+        self.assertEqual(tr.parse_temp_time("780–650 °C 10 min")[:3], (None, 10.0, F.TEMP_PROFILE))
+        self.assertEqual(tr.parse_temp_time("530 °C 30–60 min")[:3], (530.0, None, F.RANGE_UNRESOLVED))
+
+    def test_profile_with_time_range_leaves_time_unresolved(self):
+        F = tr.QualityFlag
+        self.assertEqual(tr.parse_temp_time("780–650 °C 30–60 min")[:3],
+                         (None, None, F.TEMP_PROFILE | F.RANGE_UNRESOLVED))
+
+    def test_range_after_single_time_is_still_flagged(self):
+        self.assertEqual(tr.parse_temp_time("650 °C 10 min then 30–60 min")[:3],
+                         (650.0, None, tr.QualityFlag.RANGE_UNRESOLVED))
+
+
+TABLE = (
+    "Mo source\tSulfur source\tTemp. Time\tPressure\tCarrier gas Flow rate\tSubstrate/ Set-up\tRef\n"
+    "MoO3 powder 0.4 g\tS powder 0.8 g\t650 °C 15 min\tambient\tN2 1 sccm\tSiO2/Si face-down\t14\n"
+    "MoO3 0.0003 g 0.0005 g\tS 0.1 g <0.1 g\t∼780–650 °C 30–60 min\t30 Pa\tAr14 sccm H2/2 sccm\tSiO2/Si\t56\n"
+    "MoO3 - \tS powder ∼1 g\t∼700 °C 5 min\t–\tnone\tSiO2\t23\n"
+)
+PAPER = {"doi": "10.1002/cvde.201500060", "title": "t", "year": 2015, "venue": "v", "url": None}
+
+
+def table_records():
+    return tr.table_to_records(tr.parse_table_block(TABLE), PAPER, table_id="t3")
+
+
+class QualityFlagsTest(unittest.TestCase):
+    def test_flags_come_out_in_fixed_order_without_duplicates(self):
+        recs = table_records()
+        self.assertEqual([r.quality["flags"] for r in recs], [
+            ["pressure_assumed_ambient", "review_table_row", "cited_ref_14"],
+            ["approximate_value_present", "temperature_profile_unparsed", "range_value_unresolved",
+             "inequality_value_present", "review_table_row", "cited_ref_56",
+             "row_split_into_multiple_conditions"],
+            ["approximate_value_present", "temperature_profile_unparsed", "range_value_unresolved",
+             "inequality_value_present", "review_table_row", "cited_ref_56",
+             "row_split_into_multiple_conditions"],
+            # "∼" in both the temperature and S cells is reported once
+            ["approximate_value_present", "pressure_missing", "gas_flow_unparsed",
+             "mo_source_amount_missing", "review_table_row", "cited_ref_23"],
+        ])
+
+    def test_flag_names_follows_bit_order(self):
+        F = tr.QualityFlag
+        self.assertEqual(tr.flag_names(F.REVIEW_TABLE_ROW | F.RANGE_UNRESOLVED | F.APPROXIMATE),
+                         ["approximate_value_present", "range_value_unresolved", "review_table_row"])
+
+
+class RecordIdTest(unittest.TestCase):
+    def test_ids_match_sha_id(self):
+        self.assertEqual([r.record_id for r in table_records()],
+                         [tr.sha_id(PAPER["doi"], rid) for rid in ("t3_r1", "t3_r2_1", "t3_r2_2", "t3_r3")])
+
+    def test_row_to_records_alone_gives_same_ids(self):
+        rows = tr.parse_table_block(TABLE)
+        self.assertEqual([r.record_id for r in tr.row_to_records(rows[1], PAPER, "t3", 2)],
+                         [tr.sha_id(PAPER["doi"], "t3_r2_1"), tr.sha_id(PAPER["doi"], "t3_r2_2")])
+
+
+class MissingRequiredFieldsTest(unittest.TestCase):
+    def test_null_material_and_method_are_reported(self):
+        saved = tr.TABLE_MATERIAL, tr.TABLE_GROWTH_METHOD
+        tr.TABLE_MATERIAL = tr.TABLE_GROWTH_METHOD = None
+        try:
+            recs = table_records()
+            cols = tr.table_to_columns(tr.parse_table_block(TABLE), PAPER, table_id="t3")
+        finally:
+            tr.TABLE_MATERIAL, tr.TABLE_GROWTH_METHOD = saved
+        self.assertEqual([r.condition["material"] for r in recs], [None] * 4)
+        missing = [["material", "growth_method"], ["material", "growth_method", "temperature_C"],
+                   ["material", "growth_method", "temperature_C"], ["material", "growth_method"]]
+        self.assertEqual([r.quality["missing_required_fields"] for r in recs], missing)
+        self.assertEqual(cols["missing_required_fields"], missing)
+
+    def test_missing_temperature_is_reported(self):
+        self.assertEqual([r.quality["missing_required_fields"] for r in table_records()],
+                         [[], ["temperature_C"], ["temperature_C"], []])
+
+
+class TableToColumnsTest(unittest.TestCase):
+    def table_columns(self):
+        return tr.table_to_columns(tr.parse_table_block(TABLE), PAPER, table_id="t3")
+
+    def test_matches_records(self):
+        recs = table_records()
+        cols = self.table_columns()
+        self.assertEqual(cols["record_id"], [r.record_id for r in recs])
+        self.assertEqual(cols["doi"], [r.paper["doi"] for r in recs])
+        for k in ("material", "growth_method", "substrate", "temperature_C", "pressure_Torr",
+                  "growth_time_min", "carrier_gas", "gas_flows_sccm", "reactants", "notes"):
+            self.assertEqual(cols[k], [r.condition[k] for r in recs], k)
+        for k in ("confidence", "missing_required_fields", "flags"):
+            self.assertEqual(cols[k], [r.quality[k] for r in recs], k)
+
+    def test_holds_condition_and_quality_columns_only(self):
+        self.assertEqual(list(self.table_columns()), [
+            "record_id", "doi", "material", "growth_method", "substrate",
+            "temperature_C", "pressure_Torr", "growth_time_min",
+            "carrier_gas", "gas_flows_sccm", "reactants", "notes",
+            "confidence", "missing_required_fields", "flags",
+        ])
+
+    def test_cells_are_not_shared(self):
+        cols = self.table_columns()
+        # rows 2a and 2b come from one row context
+        cols["gas_flows_sccm"][1]["Ar"] = 0.0
+        cols["carrier_gas"][1].append("X")
+        cols["reactants"][1].clear()
+        self.assertEqual(cols["gas_flows_sccm"][2], {"Ar": 14.0, "H2": 2.0})
+        self.assertEqual(cols["carrier_gas"][2], ["Ar", "H2"])
+        self.assertEqual(len(cols["reactants"][2]), 2)
+
+
+class DumpsRecordTest(unittest.TestCase):
+    def test_stdlib_fallback_decodes_to_same_record(self):
+        for r in table_records():
+            saved, tr.orjson = tr.orjson, None
+            try:
+                stdlib = tr.dumps_record(r)
+            finally:
+                tr.orjson = saved
+            self.assertEqual(json.loads(stdlib), tr.record_to_dict(r))
+            self.assertEqual(json.loads(tr.dumps_record(r)), json.loads(stdlib))
+
+
+if __name__ == "__main__":
+    unittest.main()